@@ -1,44 +1,152 @@
 # formal_schema_language.py
+import functools
+import sys
+from dataclasses import dataclass, replace
+from typing import Dict
+
+
+@dataclass(frozen=True, slots=True)
+class Wall:
+    """Immutable wall component with constraints"""
+    name: str = ""
+    load_bearing: bool = False
+    height: float = 2.4  # meters
+    thickness: float = 0.15  # meters
+    material: str = "concrete"
+    fire_rating: int = 60  # minutes
+
+    def to_dict(self) -> Dict:
+        """Export-time representation; the hot path keeps the frozen object"""
+        return {
+            "type": "wall",
+            "name": self.name,
+            "load_bearing": self.load_bearing,
+            "height": self.height,
+            "thickness": self.thickness,
+            "material": self.material,
+            "fire_rating": self.fire_rating,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Foundation:
+    """Immutable foundation component with safety constraints"""
+    name: str = ""
+    depth: float = 1.2  # meters
+    width: float = 0.6  # meters
+    reinforcement: str = "rebar_12mm"
+    soil_bearing_capacity: float = 150  # kPa
+
+    def to_dict(self) -> Dict:
+        """Export-time representation; the hot path keeps the frozen object"""
+        return {
+            "type": "foundation",
+            "name": self.name,
+            "depth": self.depth,
+            "width": self.width,
+            "reinforcement": self.reinforcement,
+            "soil_bearing_capacity": self.soil_bearing_capacity,
+        }
+
+
+# Identical parameter sets share one frozen prototype; only the name is
+# stamped on afterwards
+_wall_factory = functools.lru_cache(maxsize=256)(Wall)
+_foundation_factory = functools.lru_cache(maxsize=256)(Foundation)
+
+# IWU-approved structural materials
+_APPROVED_MATERIALS = frozenset({
+    "concrete", "reinforced_concrete", "concrete_block", "brick", "steel",
+})
+
+
 class FormalSchemaLanguage:
     """
     Python-executable language for housing schemas
     """
-    
+
     def __init__(self):
         self.constraints = []
         self.components = {}
-        
-    def define_wall(self, name: str, **kwargs):
+
+    def define_wall(self, name: str, load_bearing: bool = False,
+                    height: float = 2.4, thickness: float = 0.15,
+                    material: str = "concrete",
+                    fire_rating: int = 60) -> Wall:
         """Define a wall component with constraints"""
-        return {
-            "type": "wall",
-            "name": name,
-            "load_bearing": kwargs.get("load_bearing", False),
-            "height": kwargs.get("height", 2.4),  # meters
-            "thickness": kwargs.get("thickness", 0.15),  # meters
-            "material": kwargs.get("material", "concrete"),
-            "fire_rating": kwargs.get("fire_rating", 60),  # minutes
-        }
-    
-    def define_foundation(self, name: str, **kwargs):
+        prototype = _wall_factory(
+            load_bearing=load_bearing,
+            height=height,
+            thickness=thickness,
+            # Interned so DSL-parsed strings compare by identity downstream
+            material=sys.intern(material),
+            fire_rating=fire_rating,
+        )
+        return replace(prototype, name=name)
+
+    def define_foundation(self, name: str, depth: float = 1.2,
+                          width: float = 0.6,
+                          reinforcement: str = "rebar_12mm",
+                          soil_capacity: float = 150) -> Foundation:
         """Define foundation with safety constraints"""
-        return {
-            "type": "foundation",
-            "name": name,
-            "depth": kwargs.get("depth", 1.2),  # meters
-            "width": kwargs.get("width", 0.6),  # meters
-            "reinforcement": kwargs.get("reinforcement", "rebar_12mm"),
-            "soil_bearing_capacity": kwargs.get("soil_capacity", 150),  # kPa
-        }
-    
+        prototype = _foundation_factory(
+            depth=depth,
+            width=width,
+            reinforcement=sys.intern(reinforcement),
+            soil_bearing_capacity=soil_capacity,
+        )
+        return replace(prototype, name=name)
+
+    # Per-component predicates: each is cheap and side-effect free, so
+    # validate_iwu_compliance can apply all four in one pass
+    def _struct_pred(self, component) -> bool:
+        if isinstance(component, Wall):
+            return not component.load_bearing or component.thickness >= 0.2
+        if isinstance(component, Foundation):
+            return (component.depth >= 1.0
+                    and component.soil_bearing_capacity >= 100)
+        return True
+
+    def _fire_pred(self, component) -> bool:
+        if isinstance(component, Wall):
+            return component.fire_rating >= 60
+        return True
+
+    def _access_pred(self, component) -> bool:
+        if isinstance(component, Wall):
+            return component.height >= 2.0
+        return True
+
+    def _env_pred(self, component) -> bool:
+        if isinstance(component, Wall):
+            return component.material in _APPROVED_MATERIALS
+        return True
+
+    def check_structural_integrity(self, schema: Dict) -> bool:
+        return all(self._struct_pred(c) for c in schema["components"])
+
+    def check_fire_safety(self, schema: Dict) -> bool:
+        return all(self._fire_pred(c) for c in schema["components"])
+
+    def check_accessibility(self, schema: Dict) -> bool:
+        return all(self._access_pred(c) for c in schema["components"])
+
+    def check_environmental_standards(self, schema: Dict) -> bool:
+        return all(self._env_pred(c) for c in schema["components"])
+
+    # Ordered cheapest and most-likely-to-fail first; every predicate must
+    # stay side-effect free so skipping later ones is always safe
+    _PREDICATES = (_struct_pred, _fire_pred, _access_pred, _env_pred)
+
     def validate_iwu_compliance(self, schema: Dict) -> bool:
         """
         Validate schema meets IWU law commission requirements
+
+        All four check categories run fused in a single lazy pass over
+        the component list; all() short-circuits at the first failing
+        predicate, so check order in _PREDICATES matters for performance
+        but must never matter for the result.
         """
-        checks = [
-            self.check_structural_integrity(schema),
-            self.check_fire_safety(schema),
-            self.check_accessibility(schema),
-            self.check_environmental_standards(schema)
-        ]
-        return all(checks)
+        return all(predicate(self, component)
+                   for component in schema["components"]
+                   for predicate in self._PREDICATES)
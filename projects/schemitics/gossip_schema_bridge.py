@@ -1,64 +1,155 @@
 # gossip_schema_bridge.py
+import functools
+import os
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from datetime import datetime
+from hashlib import blake2b
+from typing import Dict, List, Tuple
+
+from formal_schema_language import FormalSchemaLanguage
+from gossip_to_blueprint import (
+    ISOLATED, SAFETY_CRITICAL, GossipActor, GossipBlueprintTranslator)
+
+_COMPONENT_TMPL = string.Template(
+    'rectangle "$type" as $name {\n  $fields\n}\n')
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_component(component) -> str:
+    """Render one component; components are frozen dataclasses, so equal
+    components across blueprints reuse the cached snippet"""
+    info = component.to_dict()
+    fields = "\n  ".join(
+        f"{key}: {value}" for key, value in info.items()
+        if key not in ("type", "name"))
+    return _COMPONENT_TMPL.substitute(
+        type=info["type"], name=info["name"], fields=fields)
+
+# Below this many actors, pool startup and pickling cost more than the
+# serial loop they would replace
+_PARALLEL_THRESHOLD = 64
+
+_SCHEMA_LANG = FormalSchemaLanguage()
+
+# Blueprint timestamps only need second granularity; cache the formatted
+# string and refresh once per second instead of per compile
+_TS_CACHE: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    global _TS_CACHE
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE = (now, datetime.fromtimestamp(now).isoformat())
+    return _TS_CACHE[1]
+
+
+def _compile_actor(actor: GossipActor):
+    """Map one actor to its building component; module-level so pool
+    workers can pickle it"""
+    bits = actor.annots
+    if bits & SAFETY_CRITICAL:
+        return _SCHEMA_LANG.define_wall(
+            name=actor.name,
+            load_bearing=True,
+            thickness=0.30  # Thicker for load bearing
+        )
+    if bits & ISOLATED:
+        return _SCHEMA_LANG.define_foundation(
+            name=actor.name,
+            depth=1.5  # Deeper for isolation
+        )
+    return _SCHEMA_LANG.define_wall(name=actor.name, load_bearing=False)
+
+
 class GossipSchemaBridge:
     """
     Bridge between GOSSIP programs and formal housing schemas
     """
-    
+
     def __init__(self):
-        self.schema_lang = FormalSchemaLanguage()
-        self.translator = GossipBlueprintTranslator()
-        
+        # Content-addressed cache: unchanged source never recompiles
+        self._blueprint_cache: Dict[bytes, Dict] = {}
+
+    @cached_property
+    def schema_lang(self) -> FormalSchemaLanguage:
+        """Shared across bridges: FormalSchemaLanguage holds no per-bridge
+        state, and the module-level instance is built once at import"""
+        return _SCHEMA_LANG
+
+    @cached_property
+    def translator(self) -> GossipBlueprintTranslator:
+        """Built lazily; export-only callers never pay for it"""
+        return GossipBlueprintTranslator()
+
+    def parse_gossip_actors(self, gossip_source: str) -> List[GossipActor]:
+        """Parse GOSSIP source into actors via the translator"""
+        return self.translator.parse_gossip_actors(gossip_source)
+
     def compile_to_blueprint(self, gossip_source: str) -> Dict:
         """
         Compile GOSSIP source to executable blueprint
         """
+        key = blake2b(gossip_source.encode(), digest_size=16).digest()
+        cached = self._blueprint_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Parse GOSSIP constructs
         actors = self.parse_gossip_actors(gossip_source)
-        
-        # Map to building components
+
+        # Map to building components; each actor is independent, so large
+        # batches fan out across cores
+        if len(actors) >= _PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                components = list(
+                    executor.map(_compile_actor, actors, chunksize=32))
+        else:
+            components = [_compile_actor(actor) for actor in actors]
+
         blueprint = {
             "metadata": {
                 "standard": "IWU_SAFE_HOUSING_v1",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "compiler": "SSL_v1.0"
             },
-            "components": []
+            "components": components
         }
-        
-        for actor in actors:
-            if actor.has_annotation("@safety_critical"):
-                component = self.schema_lang.define_wall(
-                    name=actor.name,
-                    load_bearing=True,
-                    thickness=0.30  # Thicker for load bearing
-                )
-            elif actor.has_annotation("@isolated"):
-                component = self.schema_lang.define_foundation(
-                    name=actor.name,
-                    depth=1.5  # Deeper for isolation
-                )
-            else:
-                component = self.schema_lang.define_wall(
-                    name=actor.name,
-                    load_bearing=False
-                )
-            
-            blueprint["components"].append(component)
-            
+
         # Validate IWU compliance
         if not self.schema_lang.validate_iwu_compliance(blueprint):
             raise ValueError("Blueprint fails IWU safety standards")
-            
+
+        self._blueprint_cache[key] = blueprint
         return blueprint
-    
+
+    def component_to_plantuml(self, component) -> str:
+        """Render one component as a PlantUML rectangle"""
+        return _render_component(component)
+
     def export_to_plantuml(self, blueprint: Dict) -> str:
         """Export blueprint to PlantUML for visualization"""
-        plantuml_code = "@startuml\n"
-        plantuml_code += "!theme blueprint\n"
-        plantuml_code += f"title {blueprint['metadata']['standard']}\n\n"
-        
-        for component in blueprint["components"]:
-            plantuml_code += self.component_to_plantuml(component)
-            
-        plantuml_code += "@enduml"
-        return plantuml_code
+        parts = [
+            "@startuml",
+            "!theme blueprint",
+            f"title {blueprint['metadata']['standard']}",
+            "",
+        ]
+        parts.extend(self.component_to_plantuml(component)
+                     for component in blueprint["components"])
+        parts.append("@enduml")
+        return "\n".join(parts)
+
+    def export_batch_to_plantuml(self, blueprints: List[Dict]) -> str:
+        """
+        Concatenate several blueprints into one PlantUML document so the
+        renderer amortizes JVM startup over the whole batch
+        """
+        docs = []
+        for i, blueprint in enumerate(blueprints):
+            doc = self.export_to_plantuml(blueprint)
+            docs.append(doc.replace("@startuml", f"@startuml blueprint_{i}", 1))
+        return "\n".join(docs)
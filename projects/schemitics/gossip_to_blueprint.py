@@ -1,58 +1,249 @@
 # gossip_to_blueprint.py
+import functools
+import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from schematic_structure_language import SchematicNode
+
+# Compiled once at import so per-actor translation never re-compiles
+_ANNOT_RE = re.compile(r"@(safety_critical|isolated)\b")
+_DIM_RE = re.compile(r"(\w+)\s*[:=]\s*([\d.]+)\s*(mm|cm|m)?\b")
+_ACTOR_DEF_RE = re.compile(r"actor\s+(\w+)")
+
+_UNIT_SCALE = {"": 1.0, "mm": 0.001, "cm": 0.01, "m": 1.0}
+
+# Annotation -> (component_type, safety_level)
+_ANNOTATION_COMPONENTS = {
+    "safety_critical": ("load_bearing_wall", "STRUCTURAL"),
+    "isolated": ("fire_wall", "FIRE_RATED"),
+}
+
+# Annotation bits, resolved once at parse time; dispatch on an actor is a
+# single integer AND instead of a string lookup
+SAFETY_CRITICAL = 1 << 0
+ISOLATED = 1 << 1
+
+_ANNOTATION_BITS = {
+    "safety_critical": SAFETY_CRITICAL,
+    "isolated": ISOLATED,
+}
+
+
+def _extract_dimensions(gossip_code: str) -> Tuple[Tuple[str, float], ...]:
+    """Extract dimension tokens (e.g. thickness: 300mm), normalized to
+    meters, packed as sorted (name, value) pairs"""
+    # Keys repeat across actors (thickness, depth, ...); interning shares
+    # one string object and makes lookups pointer compares
+    return tuple(sorted(
+        (sys.intern(name), float(value) * _UNIT_SCALE[unit])
+        for name, value, unit in _DIM_RE.findall(gossip_code)
+    ))
+
+
+def _extract_actor_name(gossip_code: str) -> str:
+    match = _ACTOR_DEF_RE.search(gossip_code)
+    return sys.intern(match.group(1)) if match else "anonymous"
+
+
+@functools.lru_cache(maxsize=1024)
+def _translate_cached(gossip_code: str) -> SchematicNode:
+    """Translate one actor fragment to a component, memoized on source text"""
+    # Fast path: no "@" anywhere means no annotation can match, so skip
+    # the regex scan entirely
+    component_type, safety_level = "partition_wall", "STANDARD"
+    if "@" in gossip_code:
+        match = _ANNOT_RE.search(gossip_code)
+        if match:
+            component_type, safety_level = _ANNOTATION_COMPONENTS[match.group(1)]
+
+    return SchematicNode(
+        component_type=component_type,
+        dimensions=_extract_dimensions(gossip_code),
+        safety_constraints=(safety_level,),
+        gossip_actor=_extract_actor_name(gossip_code)
+    )
+
+
+_MSG_RE = re.compile(r"(\w+)\s*->\s*(\w+)")
+
+
+@dataclass(frozen=True)
+class Connection:
+    """A GOSSIP message-passing edge between two actors"""
+    from_actor: str
+    to_actor: str
+
+
+@dataclass
+class ParsedFile:
+    """Parsed representation of one .rp source file"""
+    path: str
+    actors: List["GossipActor"]
+    connections: List[Connection]
+
+
+# Parsed files keyed on (path, mtime_ns, size): re-reading an unchanged
+# file is a dict hit, not a re-parse
+_ast_cache: Dict[Tuple[str, int, int], ParsedFile] = {}
+
+# On-disk actor cache, shared with the grammar cache directory; bump the
+# version whenever the parsed representation changes shape
+_PARSER_VERSION = b"schemitics-ast-v2"
+_CACHE_DIR = Path(__file__).with_name(".schemitics_cache")
+
+
+@dataclass
+class GossipActor:
+    """A GOSSIP actor with its annotations resolved to a bitmask at
+    parse time (see SAFETY_CRITICAL / ISOLATED)"""
+    name: str
+    source: str
+    annots: int = 0
+
+
 class GossipBlueprintTranslator:
     """
     Translates GOSSIP language constructs into formal housing schemas
     IWU Law Commission compliant
     """
-    
+
     def __init__(self):
         self.schema_registry = {}
         self.safety_validators = []
-        
+
     def translate_gossip_actor(self, gossip_code: str) -> SchematicNode:
         """
         Convert GOSSIP actor to building component
         """
-        # Parse GOSSIP annotations
-        if "@safety_critical" in gossip_code:
-            component_type = "load_bearing_wall"
-            safety_level = "STRUCTURAL"
-        elif "@isolated" in gossip_code:
-            component_type = "fire_wall"
-            safety_level = "FIRE_RATED"
-        else:
-            component_type = "partition_wall"
-            safety_level = "STANDARD"
-            
-        return SchematicNode(
-            component_type=component_type,
-            dimensions=self.extract_dimensions(gossip_code),
-            safety_constraints=[safety_level],
-            gossip_actor=self.extract_actor_name(gossip_code)
-        )
-    
+        return _translate_cached(gossip_code)
+
+    def parse_gossip_actors(self, gossip_source: str) -> List[GossipActor]:
+        """
+        Split GOSSIP source into actors, scanning annotations once per actor
+
+        Results persist under .schemitics_cache/ keyed on a content hash,
+        so a fresh process re-parses only sources it has never seen.
+        """
+        digest = blake2b(gossip_source.encode() + _PARSER_VERSION,
+                         digest_size=16).hexdigest()
+        cache_path = _CACHE_DIR / f"{digest}.pkl"
+        if cache_path.exists():
+            try:
+                return pickle.loads(cache_path.read_bytes())
+            except (pickle.UnpicklingError, EOFError):
+                pass  # stale or truncated entry; fall through and re-parse
+
+        actors = self._parse_actors(gossip_source)
+        try:
+            _CACHE_DIR.mkdir(exist_ok=True)
+            cache_path.write_bytes(pickle.dumps(actors, protocol=5))
+        except OSError:
+            pass  # read-only filesystem; caching is best-effort
+        return actors
+
+    def _parse_actors(self, gossip_source: str) -> List[GossipActor]:
+        matches = list(_ACTOR_DEF_RE.finditer(gossip_source))
+
+        actors = []
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(gossip_source)
+            body = gossip_source[match.start():end]
+            # "@" prefilter: annotation-free actors skip the regex pass
+            annots = 0
+            if "@" in body:
+                for annotation in _ANNOT_RE.findall(body):
+                    annots |= _ANNOTATION_BITS[annotation]
+            actors.append(GossipActor(name=sys.intern(match.group(1)),
+                                      source=body,
+                                      annots=annots))
+        return actors
+
+    def extract_dimensions(self, gossip_code: str) -> Tuple[Tuple[str, float], ...]:
+        """Extract dimension tokens from GOSSIP code"""
+        return _extract_dimensions(gossip_code)
+
+    def extract_actor_name(self, gossip_code: str) -> str:
+        """Extract the actor name from a GOSSIP fragment"""
+        return _extract_actor_name(gossip_code)
+
+    def load_gossip_file(self, path: str) -> ParsedFile:
+        """Parse a .rp file, reusing the cached AST while it is unchanged"""
+        stat = os.stat(path)
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        parsed = _ast_cache.get(key)
+        if parsed is None:
+            source = Path(path).read_text()
+            parsed = ParsedFile(
+                path=str(path),
+                actors=self.parse_gossip_actors(source),
+                connections=[Connection(a, b)
+                             for a, b in _MSG_RE.findall(source)],
+            )
+            _ast_cache[key] = parsed
+        return parsed
+
+    def _partition(self, gossip_files: List[str]) -> Tuple[
+            List[SchematicNode], List[SchematicNode], List[Connection]]:
+        """Split all actors into foundation/structural components and
+        collect connections in one pass over the files"""
+        foundations: List[SchematicNode] = []
+        structurals: List[SchematicNode] = []
+        connections: List[Connection] = []
+        for path in gossip_files:
+            parsed = self.load_gossip_file(path)
+            for actor in parsed.actors:
+                if actor.annots & ISOLATED:
+                    foundations.append(
+                        self.translate_gossip_actor(actor.source))
+                elif actor.annots & SAFETY_CRITICAL:
+                    structurals.append(
+                        self.translate_gossip_actor(actor.source))
+            connections.extend(parsed.connections)
+        return foundations, structurals, connections
+
+    def get_foundation_components(self, gossip_files: List[str]) -> List[SchematicNode]:
+        """Components for isolated actors across the given files"""
+        return self._partition(gossip_files)[0]
+
+    def get_structural_components(self, gossip_files: List[str]) -> List[SchematicNode]:
+        """Components for safety-critical actors across the given files"""
+        return self._partition(gossip_files)[1]
+
+    def extract_connections(self, gossip_files: List[str]) -> List[Connection]:
+        """Message-passing edges across the given files"""
+        return self._partition(gossip_files)[2]
+
     def generate_plantuml_blueprint(self, gossip_files: List[str]) -> str:
         """
         Generate complete PlantUML blueprint from GOSSIP code
         """
         uml = ["@startuml", "!define RECTANGLE_BORDER_COLOR #000000"]
         uml.append("title IWU Safe Housing Blueprint")
-        
+
+        # One pass over the actor set feeds all three sections
+        foundations, structurals, connections = self._partition(gossip_files)
+
         # Foundation layer (from GOSSIP isolated actors)
         uml.append("package \"Foundation\" {")
-        for component in self.get_foundation_components(gossip_files):
+        for component in foundations:
             uml.append(f"  {component.to_plantuml()}")
         uml.append("}")
-        
+
         # Structural layer (from safety_critical actors)
         uml.append("package \"Structural\" {")
-        for component in self.get_structural_components(gossip_files):
+        for component in structurals:
             uml.append(f"  {component.to_plantuml()}")
         uml.append("}")
-        
+
         # Connect components based on GOSSIP message passing
-        for connection in self.extract_connections(gossip_files):
+        for connection in connections:
             uml.append(f"{connection.from_actor} --> {connection.to_actor}")
-            
+
         uml.append("@enduml")
         return "\n".join(uml)
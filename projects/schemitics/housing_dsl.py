@@ -8,21 +8,21 @@ house "SafeHouse1" {
         depth: 1.2m
         reinforcement: mesh_200mm
     }
-    
+
     walls {
         external {
             thickness: 300mm
             material: reinforced_concrete
             fire_rating: 120min
         }
-        
+
         internal {
             thickness: 150mm
             material: concrete_block
             fire_rating: 60min
         }
     }
-    
+
     safety_features {
         emergency_exits: 2
         smoke_detectors: all_rooms
@@ -30,9 +30,118 @@ house "SafeHouse1" {
     }
 }
 """
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    from lark import Lark, Transformer
+except ImportError:  # lark is optional; the hand-written tokenizer still works
+    Lark = None
+
+# One master alternation, compiled once: a single re.finditer pass yields
+# every token without per-block recompilation or backtracking.
+_TOKEN = re.compile(
+    r"(?P<COMMENT>//[^\n]*)"
+    r"|(?P<KV>(?P<KEY>\w+)\s*:\s*(?P<VALUE>[^\n{}]+))"
+    r"|(?P<LBRACE>\{)"
+    r"|(?P<RBRACE>\})"
+    r"|(?P<STRING>\"[^\"]*\")"
+    r"|(?P<ID>\w+)"
+)
+
+# Numeric value with an optional unit; lengths normalize to meters
+_VALUE_RE = re.compile(r"([\d.]+)\s*(mm|cm|m|min)?$")
+_UNIT_SCALE = {"mm": 0.001, "cm": 0.01, "m": 1.0}
+
+
+def _coerce_value(raw: str):
+    """Coerce a DSL value to a number where possible (300mm -> 0.3)"""
+    match = _VALUE_RE.match(raw)
+    if not match:
+        return raw
+    number = float(match.group(1))
+    unit = match.group(2)
+    if unit in _UNIT_SCALE:
+        return number * _UNIT_SCALE[unit]
+    return int(number) if number.is_integer() else number
+
+
+_GRAMMAR_PATH = Path(__file__).with_name("schemitics.lark")
+_CACHE_DIR = Path(__file__).with_name(".schemitics_cache")
+_LARK_PARSER: "Optional[Lark]" = None
+
+
+def _get_lark_parser() -> "Lark":
+    """Build the LALR parser once; later runs load the cached state machine"""
+    global _LARK_PARSER
+    if _LARK_PARSER is None:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        _LARK_PARSER = Lark(
+            _GRAMMAR_PATH.read_text(),
+            parser="lalr",
+            cache=str(_CACHE_DIR / "grammar.cache"),
+        )
+    return _LARK_PARSER
+
+
+if Lark is not None:
+    class _SchemaTransformer(Transformer):
+        """Folds the parse tree straight into the schema dict"""
+
+        def kv(self, items):
+            key, value = items
+            return (str(key), _coerce_value(str(value).strip()))
+
+        def block(self, items):
+            return (str(items[0]), dict(items[1:]))
+
+        def house(self, items):
+            body: Dict = {}
+            if items and not isinstance(items[0], tuple):
+                body["name"] = str(items[0]).strip('"')
+                items = items[1:]
+            body.update(items)
+            return {"house": body}
+
+        def start(self, items):
+            return items[0]
+
+    _TRANSFORMER = _SchemaTransformer()
+
 
 class HousingDSLParser:
     def parse(self, dsl_code: str) -> Dict:
         """Parse housing DSL into formal schema"""
-        # Implementation here
-        pass
+        if Lark is not None:
+            return _TRANSFORMER.transform(_get_lark_parser().parse(dsl_code))
+        return self._parse_fallback(dsl_code)
+
+    def _parse_fallback(self, dsl_code: str) -> Dict:
+        """Single-pass tokenizer used when lark is unavailable"""
+        root: Dict = {}
+        stack = [root]
+        pending_key = None  # block keyword awaiting its "{"
+        pending_name = None  # quoted name (house "SafeHouse1") for that block
+
+        for token in _TOKEN.finditer(dsl_code):
+            kind = token.lastgroup
+            if kind == "KV":
+                stack[-1][token.group("KEY")] = _coerce_value(
+                    token.group("VALUE").strip())
+            elif kind == "LBRACE":
+                block: Dict = {}
+                if pending_name is not None:
+                    block["name"] = pending_name
+                stack[-1][pending_key or "block"] = block
+                stack.append(block)
+                pending_key = pending_name = None
+            elif kind == "RBRACE":
+                if len(stack) > 1:
+                    stack.pop()
+            elif kind == "ID":
+                pending_key = token.group("ID")
+            elif kind == "STRING":
+                pending_name = token.group("STRING").strip('"')
+
+        return root
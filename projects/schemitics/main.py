@@ -1,29 +1,83 @@
 # main.py - Bringing it all together
-from gossip_schema_bridge import GossipSchemaBridge
+import json
+import os
+import subprocess
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
+from gossip_schema_bridge import GossipSchemaBridge
+
+# Local PlantUML jar for batch rendering; rendering is skipped if absent
+PLANTUML_JAR = os.environ.get("PLANTUML_JAR", "plantuml.jar")
+
+
+def dump_blueprint(blueprint, pretty: bool = False) -> bytes:
+    """Serialize a blueprint to JSON bytes, preferring orjson when present
+
+    Components stay frozen dataclasses until this export boundary; the
+    hot path (pretty=False) skips indentation entirely.
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(blueprint, default=lambda c: c.to_dict(),
+                            option=option)
+    return json.dumps(blueprint, indent=2 if pretty else None,
+                      default=lambda c: c.to_dict()).encode()
+
+
+def render_blueprint_diagrams(puml_path: Path, fmt: str = "svg"):
+    """Render every diagram in the file with a single JVM invocation
+
+    SVG is the default: it renders faster than PNG (no rasterization or
+    AWT font work), scales without re-rendering, and can be inlined via
+    file:// links. Returns the path of the rendered diagram, or None when
+    no PlantUML jar is available.
+    """
+    if not Path(PLANTUML_JAR).exists():
+        return None
+    subprocess.run(
+        ["java", "-Djava.awt.headless=true", "-jar", PLANTUML_JAR,
+         f"-t{fmt}", str(puml_path)],
+        check=False)
+    return puml_path.with_suffix(f".{fmt}")
+
+
 def build_safe_housing():
     # Load GOSSIP robotics planning code
     gossip_code = Path("robotics_planning/hitl_recovery/hitl_recovery.rp").read_text()
-    
+
     # Initialize bridge
     bridge = GossipSchemaBridge()
-    
+
     # Compile to blueprint
     blueprint = bridge.compile_to_blueprint(gossip_code)
-    
+
     # Generate PlantUML diagram
     plantuml_diagram = bridge.export_to_plantuml(blueprint)
-    
+
     # Save for construction documentation
-    with open("housing_blueprint.puml", "w") as f:
-        f.write(plantuml_diagram)
-    
+    puml_path = Path("housing_blueprint.puml")
+    puml_path.write_text(plantuml_diagram)
+
+    # One JVM pass renders the whole document, however many diagrams it holds
+    svg_path = render_blueprint_diagrams(puml_path)
+    if svg_path is not None:
+        print(f"Blueprint diagram: file://{svg_path.resolve()}")
+
     # Validate IWU compliance
     print(f"IWU Compliant: {bridge.schema_lang.validate_iwu_compliance(blueprint)}")
-    
-    # Generate construction documents
-    print(json.dumps(blueprint, indent=2))
+
+    # Generate construction documents: compact bytes straight to disk,
+    # pretty output only for the console
+    Path("housing_blueprint.json").write_bytes(dump_blueprint(blueprint))
+    print(dump_blueprint(blueprint, pretty=True).decode())
+
 
 if __name__ == "__main__":
     build_safe_housing()
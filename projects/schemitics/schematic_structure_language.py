@@ -1,20 +1,39 @@
 # schematic_structure_language.py
-from typing import Dict, List, Any
+import string
+from typing import Any, Dict, List, Tuple
 import plantuml
 import json
 from dataclasses import dataclass
 
-@dataclass
+_NODE_TMPL = string.Template(
+    'rectangle "$t" as $a {\n'
+    '  dimensions: $d\n'
+    '  safety: $s\n'
+    '}')
+
+
+@dataclass(frozen=True, slots=True)
 class SchematicNode:
-    """Maps GOSSIP actors to buildable components"""
+    """Maps GOSSIP actors to buildable components
+
+    Dimensions are packed as a sorted tuple of (name, value) pairs so
+    nodes stay hashable, pickle compactly, and carry no per-instance
+    __dict__.
+    """
     component_type: str  # wall, foundation, roof, etc.
-    dimensions: Dict[str, float]
-    safety_constraints: List[str]
+    dimensions: Tuple[Tuple[str, float], ...]
+    safety_constraints: Tuple[str, ...]
     gossip_actor: str  # Original GOSSIP component
-    
+
+    def dimension(self, key: str, default: float = 0.0) -> float:
+        """Look up one dimension by name"""
+        for name, value in self.dimensions:
+            if name == key:
+                return value
+        return default
+
     def to_plantuml(self) -> str:
         """Convert to PlantUML diagram notation"""
-        return f"rectangle \"{self.component_type}\" as {self.gossip_actor} {{\n" \
-               f"  dimensions: {self.dimensions}\n" \
-               f"  safety: {self.safety_constraints}\n" \
-               f"}}"
+        return _NODE_TMPL.substitute(
+            t=self.component_type, a=self.gossip_actor,
+            d=dict(self.dimensions), s=list(self.safety_constraints))
@@ -0,0 +1,28 @@
+# setup.py - optional mypyc build for the translation hot path
+from setuptools import setup
+
+try:
+    # When mypyc and a C toolchain are available, the two hot modules are
+    # compiled to C extensions; otherwise the pure-Python sources ship as-is
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "formal_schema_language.py",
+        "gossip_to_blueprint.py",
+    ])
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="schemitics",
+    version="0.1.0",
+    description="GOSSIP-to-blueprint compiler for IWU safe housing schemas",
+    py_modules=[
+        "formal_schema_language",
+        "gossip_schema_bridge",
+        "gossip_to_blueprint",
+        "housing_dsl",
+        "main",
+        "schematic_structure_language",
+    ],
+    ext_modules=ext_modules,
+)